@@ -1,10 +1,19 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import plotly.express as px
+import plotly.graph_objects as go
 import numpy as np
+from dataclasses import dataclass
 from pathlib import Path
 
+# numba is optional: when available the per-rerun aggregates run as one
+# compiled pass over the filtered columns, otherwise pandas handles them
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
 # Set page configuration
 st.set_page_config(page_title="German Credit Analysis", layout="wide", page_icon="💳")
 
@@ -31,347 +40,625 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
+# Target dtypes for the dataset: categoricals so filters and groupbys
+# compare small integer codes instead of strings, and the smallest
+# integer type that fits each numeric column
+CSV_DTYPES = {
+    'Age': 'int16',
+    'Job': 'int8',
+    'Credit amount': 'int32',
+    'Duration': 'int16',
+    'Sex': 'category',
+    'Housing': 'category',
+    'Purpose': 'category',
+    'Saving accounts': 'category',
+    'Checking account': 'category'
+}
+
 # Load data function
-@st.cache_data
+@st.cache_resource
 def load_data(file_path):
-    """Load and prepare the credit data"""
+    """Load and prepare the credit data.
+
+    Cached as a shared resource: cache_data would pickle a fresh copy of
+    the frame on every access, whereas all sessions can share this one
+    instance by reference since nothing downstream mutates it (filters
+    and aggregates only ever read it).
+    """
     try:
-        df = pd.read_csv(file_path, index_col=0)
+        # Cold starts load the columnar Parquet copy written on the first
+        # run, which skips CSV parsing entirely; the mtime check discards
+        # the copy if the CSV has been replaced since
+        parquet_path = Path(file_path).with_suffix('.parquet')
+        csv_path = Path(file_path)
+        if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+            return pd.read_parquet(parquet_path)
+        if not csv_path.exists():
+            raise FileNotFoundError(file_path)
+        try:
+            # pyarrow's multithreaded CSV parser; passing the dtypes up
+            # front avoids inferring (and then converting) object columns
+            df = pd.read_csv(file_path, index_col=0, dtype=CSV_DTYPES,
+                             engine='pyarrow')
+        except ImportError:
+            df = pd.read_csv(file_path, index_col=0, dtype=CSV_DTYPES)
         # Clean column names
         df.columns = df.columns.str.strip()
+        # Project down to the columns the dashboard actually uses (the
+        # CSV_DTYPES keys); any extras in a future dataset revision would
+        # inflate every cached frame and filter scan
+        df = df[[col for col in CSV_DTYPES if col in df.columns]]
+        try:
+            df.to_parquet(parquet_path, compression='zstd')
+        except (ImportError, OSError):
+            # no parquet engine or read-only deployment; CSV still works
+            pass
         return df
     except FileNotFoundError:
         st.error(f"File not found: {file_path}")
         st.info("german_credit_data.csv")
         return None
 
+# Filter function
+@st.cache_data
+def filter_data(file_path, age_range, genders, housings, purposes):
+    """Return the filtered DataFrame for the current sidebar selections.
+
+    Cached on the filter values so unchanged selections reuse the previous
+    result instead of rebuilding the boolean masks on every rerun. Callers
+    must pass the multiselect values as tuples so the key is hashable.
+    """
+    df = load_data(file_path)
+    if len(df) > 2000:
+        # query fuses the four predicates through numexpr in one pass
+        # instead of materialising four intermediate boolean arrays;
+        # for small frames its parsing overhead outweighs the gain
+        return df.query(
+            "@age_range[0] <= Age <= @age_range[1]"
+            " and Sex in @genders"
+            " and Housing in @housings"
+            " and Purpose in @purposes"
+        )
+    return df[
+        (df['Age'] >= age_range[0]) &
+        (df['Age'] <= age_range[1]) &
+        (df['Sex'].isin(genders)) &
+        (df['Housing'].isin(housings)) &
+        (df['Purpose'].isin(purposes))
+    ]
+
+@st.cache_data
+def csv_bytes(file_path, age_range, genders, housings, purposes):
+    """CSV export of the filtered rows, built once per filter selection
+    instead of on every rerun of the Data Table view"""
+    filtered = filter_data(file_path, age_range, genders, housings, purposes)
+    return filtered.to_csv(index=False).encode()
+
+@dataclass(frozen=True)
+class Columns:
+    """Structure-of-arrays view of the dataset.
+
+    The analysis views and aggregates work on these flat arrays plus a
+    boolean row mask, so a rerun never gathers whole DataFrame rows;
+    categoricals are carried as their integer codes with the category
+    labels alongside. The full filtered frame is only materialised for
+    the Data Table view.
+    """
+    age: np.ndarray
+    job: np.ndarray
+    credit: np.ndarray
+    duration: np.ndarray
+    sex: np.ndarray
+    housing: np.ndarray
+    purpose: np.ndarray
+    saving: np.ndarray
+    checking: np.ndarray
+    sex_labels: tuple
+    housing_labels: tuple
+    purpose_labels: tuple
+    saving_labels: tuple
+    checking_labels: tuple
+
+@st.cache_resource
+def load_columns(file_path):
+    """Unpack the dataset into plain numpy arrays, shared by reference"""
+    df = load_data(file_path)
+    if df is None:
+        return None
+    return Columns(
+        age=df['Age'].to_numpy(),
+        job=df['Job'].to_numpy(),
+        credit=df['Credit amount'].to_numpy(),
+        duration=df['Duration'].to_numpy(),
+        sex=df['Sex'].cat.codes.to_numpy(),
+        housing=df['Housing'].cat.codes.to_numpy(),
+        purpose=df['Purpose'].cat.codes.to_numpy(),
+        saving=df['Saving accounts'].cat.codes.to_numpy(),
+        checking=df['Checking account'].cat.codes.to_numpy(),
+        sex_labels=tuple(df['Sex'].cat.categories),
+        housing_labels=tuple(df['Housing'].cat.categories),
+        purpose_labels=tuple(df['Purpose'].cat.categories),
+        saving_labels=tuple(df['Saving accounts'].cat.categories),
+        checking_labels=tuple(df['Checking account'].cat.categories)
+    )
+
+@st.cache_data
+def filter_mask(file_path, age_range, genders, housings, purposes):
+    """Boolean row mask for the current sidebar selections.
+
+    A mask over the column arrays is far smaller than a filtered copy of
+    the frame and is all the analysis views need.
+    """
+    cols = load_columns(file_path)
+    mask = (cols.age >= age_range[0]) & (cols.age <= age_range[1])
+    mask &= np.isin(cols.sex, [cols.sex_labels.index(g) for g in genders])
+    mask &= np.isin(cols.housing, [cols.housing_labels.index(h) for h in housings])
+    mask &= np.isin(cols.purpose, [cols.purpose_labels.index(p) for p in purposes])
+    return mask
+
+if HAVE_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _sum_kernel(age, credit, duration):
+        """Fused column sums: one pass over the rows instead of one
+        full scan per aggregate"""
+        age_total = 0.0
+        credit_total = 0.0
+        duration_total = 0.0
+        for i in prange(age.shape[0]):
+            age_total += age[i]
+            credit_total += credit[i]
+            duration_total += duration[i]
+        return age_total, credit_total, duration_total
+
+def cat_counts(codes, labels):
+    """Counts per category from the integer codes of a categorical.
+
+    One bincount pass with no hash table; missing values (code -1) are
+    skipped and unobserved categories dropped, leaving the descending
+    order value_counts would give.
+    """
+    counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+    series = pd.Series(counts, index=list(labels))
+    return series[counts > 0].sort_values(ascending=False)
+
+def group_means(codes, labels, values):
+    """Mean of values per category, computed via bincount on the codes.
+
+    Matches groupby(...).mean() for the low-cardinality categoricals used
+    here, but runs as two vectorised bincount passes over the int8 codes
+    instead of building a group dictionary. Unobserved categories are
+    dropped, as groupby(observed=True) would.
+    """
+    counts = np.bincount(codes, minlength=len(labels))
+    sums = np.bincount(codes, weights=values, minlength=len(labels))
+    means = pd.Series(sums / np.maximum(counts, 1), index=list(labels))
+    return means[counts > 0]
+
+# Cached figure builders
+# Each builder takes plain tuples/scalars (cheap to hash) and returns a
+# Plotly figure, so reruns with unchanged data reuse the cached chart.
+# Plotly figures ship to the browser as JSON and render client-side,
+# instead of being rasterised to a PNG on the server like matplotlib.
+# Shared layout template, built once and attached to every figure by
+# reference instead of expanding the same style dicts per figure
+_TEMPLATE = go.layout.Template(layout=dict(title_font_size=18))
+
+def _layout(fig, title, xlabel=None, ylabel=None, rotate=0):
+    """Apply the shared title/axis styling to a figure"""
+    fig.update_layout(
+        template=_TEMPLATE,
+        title_text=title,
+        xaxis_title=xlabel,
+        yaxis_title=ylabel
+    )
+    if rotate:
+        fig.update_xaxes(tickangle=-rotate)
+    return fig
+
+@st.cache_data
+def fig_bar(items, title, xlabel, ylabel, color, horizontal=False, rotate=0):
+    """Bar chart cached on the aggregated (label, value) pairs"""
+    labels = [str(k) for k, _ in items]
+    values = [v for _, v in items]
+    if horizontal:
+        fig = go.Figure(go.Bar(x=values, y=labels, orientation='h',
+                               marker_color=color, opacity=0.8))
+    else:
+        fig = go.Figure(go.Bar(x=labels, y=values,
+                               marker_color=color, opacity=0.8))
+    return _layout(fig, title, xlabel, ylabel, rotate)
+
+@st.cache_data
+def fig_pie(items, title, colors=None, bold_pct=False):
+    """Pie chart cached on the aggregated (label, value) pairs"""
+    labels = [str(k) for k, _ in items]
+    values = [v for _, v in items]
+    if colors is None:
+        colors = px.colors.qualitative.Set3
+    fig = go.Figure(go.Pie(labels=labels, values=values,
+                           marker_colors=list(colors), rotation=90,
+                           texttemplate='%{percent:.1%}'))
+    if bold_pct:
+        fig.update_traces(textfont=dict(color='white', weight='bold'))
+    return _layout(fig, title)
+
+@st.cache_data
+def fig_hist(values, bins, color, title, xlabel, mean_value, mean_label):
+    """Histogram with a mean marker, cached on the raw values tuple"""
+    fig = go.Figure(go.Histogram(x=values, nbinsx=bins,
+                                 marker_color=color, opacity=0.7))
+    fig.add_vline(x=mean_value, line_dash='dash', line_color='red',
+                  annotation_text=mean_label, annotation_position='top right')
+    return _layout(fig, title, xlabel, 'Frequency')
+
+@st.cache_data
+def fig_scatter(x, y, c, title, xlabel, ylabel, clabel):
+    """Scatter plot colored by a third variable, rendered via WebGL"""
+    fig = go.Figure(go.Scattergl(x=list(x), y=list(y), mode='markers',
+                                 marker=dict(color=list(c), opacity=0.5,
+                                             colorscale='Viridis', showscale=True,
+                                             colorbar_title_text=clabel)))
+    return _layout(fig, title, xlabel, ylabel)
+
+def box_stats(values):
+    """Five-number summary (min, q1, median, q3, max) of one group"""
+    return tuple(np.percentile(values, [0, 25, 50, 75, 100]))
+
+@st.cache_data
+def fig_box(groups, title, xlabel, ylabel, rotate=0):
+    """Box plot per group from precomputed five-number summaries.
+
+    Taking the box_stats tuples instead of raw points keeps the cache
+    key at five floats per group and lets Plotly draw the boxes directly
+    rather than running its own quartile pass over the data.
+    """
+    fig = go.Figure()
+    for label, (lo, q1, median, q3, hi) in groups:
+        fig.add_trace(go.Box(name=str(label), lowerfence=[lo], q1=[q1],
+                             median=[median], q3=[q3], upperfence=[hi],
+                             showlegend=False))
+    return _layout(fig, title, xlabel, ylabel, rotate)
+
+@st.cache_data
+def fig_grouped_bar(index, columns, values, title, xlabel, ylabel,
+                    colors, legend_title):
+    """Grouped bar chart cached on a flattened crosstab"""
+    labels = [str(i) for i in index]
+    fig = go.Figure()
+    for j, column in enumerate(columns):
+        fig.add_trace(go.Bar(x=labels, y=[row[j] for row in values],
+                             name=str(column), marker_color=colors[j]))
+    fig.update_layout(barmode='group', legend_title_text=legend_title)
+    return _layout(fig, title, xlabel, ylabel, rotate=45)
+
 # Main title
 st.title("🏦 German Credit Data Analytics Dashboard")
 st.markdown("### Comprehensive Analysis of Credit Risk Patterns and Customer Demographics")
 
 # Load data
 data_file = "german_credit_data.csv"
-df = load_data(data_file)
+cols = load_columns(data_file)
 
-if df is not None:
+if cols is not None:
     # Sidebar filters
     st.sidebar.header("📊 Filters")
     
     # Age filter
     age_range = st.sidebar.slider(
         "Age Range",
-        int(df['Age'].min()),
-        int(df['Age'].max()),
-        (int(df['Age'].min()), int(df['Age'].max()))
+        int(cols.age.min()),
+        int(cols.age.max()),
+        (int(cols.age.min()), int(cols.age.max()))
     )
     
     # Gender filter
     gender_filter = st.sidebar.multiselect(
         "Gender",
-        options=df['Sex'].unique(),
-        default=df['Sex'].unique()
+        options=cols.sex_labels,
+        default=cols.sex_labels
     )
     
     # Housing filter
     housing_filter = st.sidebar.multiselect(
         "Housing Type",
-        options=df['Housing'].unique(),
-        default=df['Housing'].unique()
+        options=cols.housing_labels,
+        default=cols.housing_labels
     )
     
     # Purpose filter
     purpose_filter = st.sidebar.multiselect(
         "Credit Purpose",
-        options=df['Purpose'].unique(),
-        default=df['Purpose'].unique()
+        options=cols.purpose_labels,
+        default=cols.purpose_labels
     )
     
     # Apply filters
-    filtered_df = df[
-        (df['Age'] >= age_range[0]) &
-        (df['Age'] <= age_range[1]) &
-        (df['Sex'].isin(gender_filter)) &
-        (df['Housing'].isin(housing_filter)) &
-        (df['Purpose'].isin(purpose_filter))
-    ]
+    mask = filter_mask(
+        data_file,
+        age_range,
+        tuple(gender_filter),
+        tuple(housing_filter),
+        tuple(purpose_filter)
+    )
+    # Gather each filtered column once; everything below indexes these
+    age_f = cols.age[mask]
+    credit_f = cols.credit[mask]
+    duration_f = cols.duration[mask]
+    sex_f = cols.sex[mask]
+    housing_f = cols.housing[mask]
+    purpose_f = cols.purpose[mask]
+    n_rows = int(age_f.shape[0])
     
+    # Aggregate the shared statistics once instead of re-scanning the
+    # filtered columns in every metric and finding below
+    if HAVE_NUMBA and n_rows:
+        # single fused pass over the three numeric columns
+        age_sum, credit_sum, duration_sum = _sum_kernel(age_f, credit_f, duration_f)
+        mean_age = age_sum / n_rows
+        mean_credit = credit_sum / n_rows
+        total_credit = credit_sum
+        mean_duration = duration_sum / n_rows
+        median_credit = np.median(credit_f)
+    elif n_rows:
+        mean_age = age_f.mean()
+        mean_credit = credit_f.mean()
+        median_credit = np.median(credit_f)
+        total_credit = credit_f.sum()
+        mean_duration = duration_f.mean()
+    else:
+        mean_age = mean_credit = median_credit = mean_duration = float('nan')
+        total_credit = 0
+    # One count pass per categorical, shared by the charts and findings
+    gender_counts = cat_counts(sex_f, cols.sex_labels)
+    housing_counts = cat_counts(housing_f, cols.housing_labels)
+    purpose_counts = cat_counts(purpose_f, cols.purpose_labels)
+
     # Key Metrics
     st.header("📈 Key Metrics")
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        st.metric("Total Records", len(filtered_df))
+        st.metric("Total Records", n_rows)
     
     with col2:
-        st.metric("Average Age", f"{filtered_df['Age'].mean():.1f}")
+        st.metric("Average Age", f"{mean_age:.1f}")
     
     with col3:
-        st.metric("Avg Credit Amount", f"€{filtered_df['Credit amount'].mean():.0f}")
+        st.metric("Avg Credit Amount", f"€{mean_credit:.0f}")
     
     with col4:
-        st.metric("Avg Duration", f"{filtered_df['Duration'].mean():.1f} mo")
+        st.metric("Avg Duration", f"{mean_duration:.1f} mo")
     
     with col5:
-        st.metric("Total Credit", f"€{filtered_df['Credit amount'].sum()/1000:.0f}K")
+        st.metric("Total Credit", f"€{total_credit/1000:.0f}K")
     
-    # Analysis tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "📊 Overview", 
-        "👥 Demographics", 
-        "💰 Credit Analysis", 
-        "🎯 Purpose Analysis",
-        "📋 Data Table"
-    ])
+    # Analysis views
+    # st.tabs renders every tab's charts on each rerun even though only
+    # one is visible; a radio-backed selector lets us build just the
+    # active view's figures
+    view = st.radio(
+        "View",
+        [
+            "📊 Overview",
+            "👥 Demographics",
+            "💰 Credit Analysis",
+            "🎯 Purpose Analysis",
+            "📋 Data Table"
+        ],
+        horizontal=True,
+        label_visibility="collapsed"
+    )
     
-    # Tab 1: Overview
-    with tab1:
+    # View 1: Overview
+    if view == "📊 Overview":
         st.header("Overview Analysis")
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Age Distribution")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            age_bins = [0, 25, 35, 45, 55, 65, 100]
+            age_bin_edges = [25, 35, 45, 55, 65]
             age_labels = ['<25', '25-35', '35-45', '45-55', '55-65', '65+']
-            filtered_df['Age_Group'] = pd.cut(filtered_df['Age'], bins=age_bins, labels=age_labels)
-            age_counts = filtered_df['Age_Group'].value_counts().sort_index()
-            ax.bar(age_counts.index, age_counts.values, color='#1f77b4', alpha=0.8)
-            ax.set_xlabel('Age Group', fontsize=12)
-            ax.set_ylabel('Count', fontsize=12)
-            ax.set_title('Distribution of Applicants by Age', fontsize=14, fontweight='bold')
-            plt.xticks(rotation=45)
-            st.pyplot(fig)
-            plt.close()
+            # searchsorted + bincount bins the ages directly, skipping the
+            # Categorical that pd.cut would allocate (side='left' keeps the
+            # right-closed bins pd.cut used, e.g. age 35 falls in 25-35)
+            age_idx = np.searchsorted(age_bin_edges, age_f, side='left')
+            age_counts = np.bincount(age_idx, minlength=len(age_labels))
+            st.plotly_chart(fig_bar(tuple(zip(age_labels, age_counts)),
+                                    'Distribution of Applicants by Age',
+                                    'Age Group', 'Count', '#1f77b4', rotate=45), width='stretch')
         
         with col2:
             st.subheader("Gender Distribution")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            gender_counts = filtered_df['Sex'].value_counts()
-            colors = ['#ff7f0e', '#2ca02c']
-            ax.pie(gender_counts.values, labels=gender_counts.index, autopct='%1.1f%%',
-                   colors=colors, startangle=90)
-            ax.set_title('Gender Distribution', fontsize=14, fontweight='bold')
-            st.pyplot(fig)
-            plt.close()
+            st.plotly_chart(fig_pie(tuple(gender_counts.items()),
+                                    'Gender Distribution',
+                                    colors=('#ff7f0e', '#2ca02c')), width='stretch')
         
         col3, col4 = st.columns(2)
         
         with col3:
             st.subheader("Housing Type Distribution")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            housing_counts = filtered_df['Housing'].value_counts()
-            ax.bar(housing_counts.index, housing_counts.values, color='#2ca02c', alpha=0.8)
-            ax.set_xlabel('Housing Type', fontsize=12)
-            ax.set_ylabel('Count', fontsize=12)
-            ax.set_title('Housing Type Distribution', fontsize=14, fontweight='bold')
-            plt.xticks(rotation=45)
-            st.pyplot(fig)
-            plt.close()
+            st.plotly_chart(fig_bar(tuple(housing_counts.items()),
+                                    'Housing Type Distribution',
+                                    'Housing Type', 'Count', '#2ca02c', rotate=45), width='stretch')
         
         with col4:
             st.subheader("Job Category Distribution")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            job_counts = filtered_df['Job'].value_counts().sort_index()
-            ax.bar(job_counts.index, job_counts.values, color='#d62728', alpha=0.8)
-            ax.set_xlabel('Job Category', fontsize=12)
-            ax.set_ylabel('Count', fontsize=12)
-            ax.set_title('Job Category Distribution', fontsize=14, fontweight='bold')
-            st.pyplot(fig)
-            plt.close()
+            job_counts = pd.Series(np.bincount(cols.job[mask]))
+            job_counts = job_counts[job_counts > 0]
+            st.plotly_chart(fig_bar(tuple(job_counts.items()),
+                                    'Job Category Distribution',
+                                    'Job Category', 'Count', '#d62728'), width='stretch')
     
-    # Tab 2: Demographics
-    with tab2:
+    # View 2: Demographics
+    elif view == "👥 Demographics":
         st.header("Demographic Analysis")
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Age by Gender")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            filtered_df.boxplot(column='Age', by='Sex', ax=ax)
-            ax.set_xlabel('Gender', fontsize=12)
-            ax.set_ylabel('Age', fontsize=12)
-            ax.set_title('Age Distribution by Gender', fontsize=14, fontweight='bold')
-            plt.suptitle('')
-            st.pyplot(fig)
-            plt.close()
+            age_by_sex = tuple((label, box_stats(age_f[sex_f == i]))
+                               for i, label in enumerate(cols.sex_labels)
+                               if gender_counts.get(label, 0))
+            st.plotly_chart(fig_box(age_by_sex, 'Age Distribution by Gender',
+                                    'Gender', 'Age'), width='stretch')
         
         with col2:
             st.subheader("Saving Accounts Distribution")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            saving_counts = filtered_df['Saving accounts'].value_counts()
-            colors = plt.cm.Set3(range(len(saving_counts)))
-            ax.pie(saving_counts.values, labels=saving_counts.index, autopct='%1.1f%%',
-                   colors=colors, startangle=90)
-            ax.set_title('Saving Accounts Status', fontsize=14, fontweight='bold')
-            st.pyplot(fig)
-            plt.close()
+            saving_counts = cat_counts(cols.saving[mask], cols.saving_labels)
+            st.plotly_chart(fig_pie(tuple(saving_counts.items()),
+                                    'Saving Accounts Status'), width='stretch')
         
         col3, col4 = st.columns(2)
         
         with col3:
             st.subheader("Checking Account Distribution")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            checking_counts = filtered_df['Checking account'].value_counts()
-            ax.bar(checking_counts.index, checking_counts.values, color='#9467bd', alpha=0.8)
-            ax.set_xlabel('Checking Account Status', fontsize=12)
-            ax.set_ylabel('Count', fontsize=12)
-            ax.set_title('Checking Account Distribution', fontsize=14, fontweight='bold')
-            plt.xticks(rotation=45)
-            st.pyplot(fig)
-            plt.close()
+            checking_counts = cat_counts(cols.checking[mask], cols.checking_labels)
+            st.plotly_chart(fig_bar(tuple(checking_counts.items()),
+                                    'Checking Account Distribution',
+                                    'Checking Account Status', 'Count',
+                                    '#9467bd', rotate=45), width='stretch')
         
         with col4:
             st.subheader("Housing by Gender")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            housing_gender = pd.crosstab(filtered_df['Housing'], filtered_df['Sex'])
-            housing_gender.plot(kind='bar', ax=ax, color=['#ff7f0e', '#2ca02c'])
-            ax.set_xlabel('Housing Type', fontsize=12)
-            ax.set_ylabel('Count', fontsize=12)
-            ax.set_title('Housing Type by Gender', fontsize=14, fontweight='bold')
-            ax.legend(title='Gender')
-            plt.xticks(rotation=45)
-            st.pyplot(fig)
-            plt.close()
+            # crosstab via one bincount over the combined codes
+            pair = housing_f.astype(np.int64) * len(cols.sex_labels) + sex_f
+            housing_gender = np.bincount(
+                pair, minlength=len(cols.housing_labels) * len(cols.sex_labels)
+            ).reshape(len(cols.housing_labels), len(cols.sex_labels))
+            st.plotly_chart(fig_grouped_bar(cols.housing_labels,
+                                            cols.sex_labels,
+                                            tuple(map(tuple, housing_gender)),
+                                            'Housing Type by Gender',
+                                            'Housing Type', 'Count',
+                                            ('#ff7f0e', '#2ca02c'), 'Gender'), width='stretch')
     
-    # Tab 3: Credit Analysis
-    with tab3:
+    # View 3: Credit Analysis
+    elif view == "💰 Credit Analysis":
         st.header("Credit Analysis")
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Credit Amount Distribution")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.hist(filtered_df['Credit amount'], bins=30, color='#1f77b4', alpha=0.7, edgecolor='black')
-            ax.set_xlabel('Credit Amount (€)', fontsize=12)
-            ax.set_ylabel('Frequency', fontsize=12)
-            ax.set_title('Distribution of Credit Amounts', fontsize=14, fontweight='bold')
-            ax.axvline(filtered_df['Credit amount'].mean(), color='red', 
-                      linestyle='--', label=f'Mean: €{filtered_df["Credit amount"].mean():.0f}')
-            ax.legend()
-            st.pyplot(fig)
-            plt.close()
+            st.plotly_chart(fig_hist(tuple(credit_f), 30,
+                                     '#1f77b4', 'Distribution of Credit Amounts',
+                                     'Credit Amount (€)', mean_credit,
+                                     f'Mean: €{mean_credit:.0f}'), width='stretch')
         
         with col2:
             st.subheader("Duration Distribution")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.hist(filtered_df['Duration'], bins=20, color='#ff7f0e', alpha=0.7, edgecolor='black')
-            ax.set_xlabel('Duration (months)', fontsize=12)
-            ax.set_ylabel('Frequency', fontsize=12)
-            ax.set_title('Distribution of Credit Duration', fontsize=14, fontweight='bold')
-            ax.axvline(filtered_df['Duration'].mean(), color='red', 
-                      linestyle='--', label=f'Mean: {filtered_df["Duration"].mean():.1f} months')
-            ax.legend()
-            st.pyplot(fig)
-            plt.close()
+            st.plotly_chart(fig_hist(tuple(duration_f), 20,
+                                     '#ff7f0e', 'Distribution of Credit Duration',
+                                     'Duration (months)', mean_duration,
+                                     f'Mean: {mean_duration:.1f} months'), width='stretch')
         
         st.subheader("Credit Amount vs Duration")
-        fig, ax = plt.subplots(figsize=(12, 6))
-        scatter = ax.scatter(filtered_df['Duration'], filtered_df['Credit amount'], 
-                           alpha=0.5, c=filtered_df['Age'], cmap='viridis', s=50)
-        ax.set_xlabel('Duration (months)', fontsize=12)
-        ax.set_ylabel('Credit Amount (€)', fontsize=12)
-        ax.set_title('Credit Amount vs Duration (colored by Age)', fontsize=14, fontweight='bold')
-        plt.colorbar(scatter, label='Age', ax=ax)
-        st.pyplot(fig)
-        plt.close()
+        # Cap the scatter at 2000 points: a random sample preserves the
+        # shape of the relationship while keeping the figure size (and the
+        # cache key) bounded as the dataset grows
+        if n_rows > 2000:
+            keep = np.random.default_rng(0).choice(n_rows, 2000, replace=False)
+        else:
+            keep = slice(None)
+        st.plotly_chart(fig_scatter(tuple(duration_f[keep]),
+                                    tuple(credit_f[keep]),
+                                    tuple(age_f[keep]),
+                                    'Credit Amount vs Duration (colored by Age)',
+                                    'Duration (months)', 'Credit Amount (€)', 'Age'), width='stretch')
         
         col3, col4 = st.columns(2)
         
         with col3:
             st.subheader("Average Credit by Housing Type")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            avg_credit_housing = filtered_df.groupby('Housing')['Credit amount'].mean().sort_values(ascending=False)
-            ax.barh(avg_credit_housing.index, avg_credit_housing.values, color='#2ca02c', alpha=0.8)
-            ax.set_xlabel('Average Credit Amount (€)', fontsize=12)
-            ax.set_ylabel('Housing Type', fontsize=12)
-            ax.set_title('Average Credit by Housing Type', fontsize=14, fontweight='bold')
-            st.pyplot(fig)
-            plt.close()
+            avg_credit_housing = group_means(housing_f, cols.housing_labels,
+                                             credit_f).sort_values(ascending=False)
+            st.plotly_chart(fig_bar(tuple(avg_credit_housing.items()),
+                                    'Average Credit by Housing Type',
+                                    'Average Credit Amount (€)', 'Housing Type',
+                                    '#2ca02c', horizontal=True), width='stretch')
         
         with col4:
             st.subheader("Credit Amount by Gender")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            filtered_df.boxplot(column='Credit amount', by='Sex', ax=ax)
-            ax.set_xlabel('Gender', fontsize=12)
-            ax.set_ylabel('Credit Amount (€)', fontsize=12)
-            ax.set_title('Credit Amount Distribution by Gender', fontsize=14, fontweight='bold')
-            plt.suptitle('')
-            st.pyplot(fig)
-            plt.close()
+            credit_by_sex = tuple((label, box_stats(credit_f[sex_f == i]))
+                                  for i, label in enumerate(cols.sex_labels)
+                                  if gender_counts.get(label, 0))
+            st.plotly_chart(fig_box(credit_by_sex,
+                                    'Credit Amount Distribution by Gender',
+                                    'Gender', 'Credit Amount (€)'), width='stretch')
     
-    # Tab 4: Purpose Analysis
-    with tab4:
+    # View 4: Purpose Analysis
+    elif view == "🎯 Purpose Analysis":
         st.header("Credit Purpose Analysis")
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Purpose Distribution")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            purpose_counts = filtered_df['Purpose'].value_counts()
-            ax.barh(purpose_counts.index, purpose_counts.values, color='#d62728', alpha=0.8)
-            ax.set_xlabel('Count', fontsize=12)
-            ax.set_ylabel('Purpose', fontsize=12)
-            ax.set_title('Credit Purpose Distribution', fontsize=14, fontweight='bold')
-            st.pyplot(fig)
-            plt.close()
+            st.plotly_chart(fig_bar(tuple(purpose_counts.items()),
+                                    'Credit Purpose Distribution',
+                                    'Count', 'Purpose', '#d62728',
+                                    horizontal=True), width='stretch')
         
         with col2:
             st.subheader("Purpose Percentage")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            purpose_counts = filtered_df['Purpose'].value_counts()
-            colors = plt.cm.Set3(range(len(purpose_counts)))
-            wedges, texts, autotexts = ax.pie(purpose_counts.values, labels=purpose_counts.index, 
-                                               autopct='%1.1f%%', colors=colors, startangle=90)
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-            ax.set_title('Purpose Distribution (%)', fontsize=14, fontweight='bold')
-            st.pyplot(fig)
-            plt.close()
+            st.plotly_chart(fig_pie(tuple(purpose_counts.items()),
+                                    'Purpose Distribution (%)', bold_pct=True), width='stretch')
         
         st.subheader("Average Credit Amount by Purpose")
-        fig, ax = plt.subplots(figsize=(12, 6))
-        avg_credit_purpose = filtered_df.groupby('Purpose')['Credit amount'].mean().sort_values(ascending=False)
-        ax.bar(avg_credit_purpose.index, avg_credit_purpose.values, color='#8c564b', alpha=0.8)
-        ax.set_xlabel('Purpose', fontsize=12)
-        ax.set_ylabel('Average Credit Amount (€)', fontsize=12)
-        ax.set_title('Average Credit Amount by Purpose', fontsize=14, fontweight='bold')
-        plt.xticks(rotation=45, ha='right')
-        st.pyplot(fig)
-        plt.close()
+        avg_credit_purpose = group_means(purpose_f, cols.purpose_labels,
+                                         credit_f).sort_values(ascending=False)
+        st.plotly_chart(fig_bar(tuple(avg_credit_purpose.items()),
+                                'Average Credit Amount by Purpose',
+                                'Purpose', 'Average Credit Amount (€)',
+                                '#8c564b', rotate=45), width='stretch')
         
         st.subheader("Duration by Purpose")
-        fig, ax = plt.subplots(figsize=(12, 6))
-        filtered_df.boxplot(column='Duration', by='Purpose', ax=ax)
-        ax.set_xlabel('Purpose', fontsize=12)
-        ax.set_ylabel('Duration (months)', fontsize=12)
-        ax.set_title('Credit Duration by Purpose', fontsize=14, fontweight='bold')
-        plt.suptitle('')
-        plt.xticks(rotation=45, ha='right')
-        st.pyplot(fig)
-        plt.close()
+        duration_by_purpose = tuple((label, box_stats(duration_f[purpose_f == i]))
+                                    for i, label in enumerate(cols.purpose_labels)
+                                    if purpose_counts.get(label, 0))
+        st.plotly_chart(fig_box(duration_by_purpose, 'Credit Duration by Purpose',
+                                'Purpose', 'Duration (months)', rotate=45), width='stretch')
     
-    # Tab 5: Data Table
-    with tab5:
+    # View 5: Data Table
+    elif view == "📋 Data Table":
         st.header("Data Explorer")
         
+        # The only view that needs whole rows: materialise the filtered
+        # frame here instead of on every rerun
+        filtered_df = filter_data(
+            data_file,
+            age_range,
+            tuple(gender_filter),
+            tuple(housing_filter),
+            tuple(purpose_filter)
+        )
+        
         # Statistical summary
         st.subheader("Statistical Summary")
         st.dataframe(filtered_df.describe())
         
-        # Show raw data
+        # Show raw data, one page at a time: serialising the whole frame
+        # to the browser on every rerun is the expensive part, a page is
+        # a constant 100 rows regardless of the filter size
         st.subheader("Raw Data")
-        st.dataframe(filtered_df)
+        page_size = 100
+        n_pages = max((len(filtered_df) - 1) // page_size + 1, 1)
+        page = st.number_input("Page", min_value=1, max_value=n_pages, value=1)
+        st.dataframe(filtered_df.iloc[(page - 1) * page_size:page * page_size])
+        st.caption(f"Page {page} of {n_pages} · {len(filtered_df)} rows")
         
-        # Download button
-        csv = filtered_df.to_csv(index=False)
+        # Download button (the CSV bytes are cached per filter selection)
         st.download_button(
             label="📥 Download Filtered Data as CSV",
-            data=csv,
+            data=csv_bytes(
+                data_file,
+                age_range,
+                tuple(gender_filter),
+                tuple(housing_filter),
+                tuple(purpose_filter)
+            ),
             file_name="filtered_credit_data.csv",
             mime="text/csv"
         )
@@ -379,32 +666,46 @@ if df is not None:
     # Key Findings
     st.header("🔍 Key Findings")
     
+    # Look up each count once and derive its percentage with a single
+    # division (denominator guarded so an empty filter shows 0 rather
+    # than dividing by zero)
+    denom = max(n_rows, 1)
+    male_count = gender_counts.get('male', 0)
+    female_count = gender_counts.get('female', 0)
+    own_count = housing_counts.get('own', 0)
+    top_housing = housing_counts.idxmax() if len(housing_counts) else 'n/a'
+    top_purpose = purpose_counts.idxmax() if len(purpose_counts) else 'n/a'
+    # non-missing == code >= 0: a popcount over int8 codes, no string
+    # comparison involved (the CSV's literal NA parses as missing)
+    savings_count = int((cols.saving[mask] >= 0).sum())
+    checking_count = int((cols.checking[mask] >= 0).sum())
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
         st.info(f"""
         **👥 Customer Profile**
-        - Average age: {filtered_df['Age'].mean():.1f} years
-        - Male: {(filtered_df['Sex']=='male').sum()} ({(filtered_df['Sex']=='male').sum()/len(filtered_df)*100:.1f}%)
-        - Female: {(filtered_df['Sex']=='female').sum()} ({(filtered_df['Sex']=='female').sum()/len(filtered_df)*100:.1f}%)
-        - Most common housing: {filtered_df['Housing'].mode()[0]}
+        - Average age: {mean_age:.1f} years
+        - Male: {male_count} ({male_count/denom*100:.1f}%)
+        - Female: {female_count} ({female_count/denom*100:.1f}%)
+        - Most common housing: {top_housing}
         """)
     
     with col2:
         st.success(f"""
         **💰 Credit Patterns**
-        - Average credit: €{filtered_df['Credit amount'].mean():.0f}
-        - Median credit: €{filtered_df['Credit amount'].median():.0f}
-        - Average duration: {filtered_df['Duration'].mean():.1f} months
-        - Most common purpose: {filtered_df['Purpose'].mode()[0]}
+        - Average credit: €{mean_credit:.0f}
+        - Median credit: €{median_credit:.0f}
+        - Average duration: {mean_duration:.1f} months
+        - Most common purpose: {top_purpose}
         """)
     
     with col3:
         st.warning(f"""
         **📊 Risk Indicators**
-        - Applicants with savings: {(filtered_df['Saving accounts']!='NA').sum()}
-        - Applicants with checking: {(filtered_df['Checking account']!='NA').sum()}
-        - Own housing: {(filtered_df['Housing']=='own').sum()} ({(filtered_df['Housing']=='own').sum()/len(filtered_df)*100:.1f}%)
+        - Applicants with savings: {savings_count}
+        - Applicants with checking: {checking_count}
+        - Own housing: {own_count} ({own_count/denom*100:.1f}%)
         """)
 
 else:
@@ -414,4 +715,4 @@ else:
     1. Save your CSV file as 'german_credit_data.csv'
     2. Place it in the same folder as this Python script
     3. Run: `streamlit run credit_dashboard.py`
-    """)
\ No newline at end of file
+    """)